@@ -19,31 +19,41 @@ class MATLABBackendHandler():
         self.matlab_engine.addpath('Backend/MATLAB')
 
 
-    def run_seaqt(self) -> None:
+    def run_seaqt(self, background: bool = False):
         '''
         Start the SEAQT backend process(es).
 
-        :return: True iff the SEAQT backend was successfully started; False otherwise
+        :param background: If True, return immediately with a MATLAB FutureResult instead of blocking
+        :return: The MATLAB FutureResult if running in the background; None otherwise
         '''
-        self.matlab_engine.start_seaqt(nargout=0)
+        return self.matlab_engine.start_seaqt(nargout=0, background=background)
 
 
-    def run_seaqt_electron_only(self) -> None:
+    def run_seaqt_electron_only(self, background: bool = False):
         '''
-        Comment
+        Start the SEAQT backend process(es) for the electron local systems only.
+
+        :param background: If True, return immediately with a MATLAB FutureResult instead of blocking
+        :return: The MATLAB FutureResult if running in the background; None otherwise
         '''
-        self.matlab_engine.start_seaqt_electron_only(nargout=0)
+        return self.matlab_engine.start_seaqt_electron_only(nargout=0, background=background)
     
 
-    def run_seaqt_phonon_only(self) -> None:
+    def run_seaqt_phonon_only(self, background: bool = False):
         '''
-        Comment
+        Start the SEAQT backend process(es) for the phonon local systems only.
+
+        :param background: If True, return immediately with a MATLAB FutureResult instead of blocking
+        :return: The MATLAB FutureResult if running in the background; None otherwise
         '''
-        self.matlab_engine.start_seaqt_phonon_only(nargout=0)
+        return self.matlab_engine.start_seaqt_phonon_only(nargout=0, background=background)
 
 
-    def generate_plot(self) -> None:
+    def generate_plot(self, background: bool = False):
         '''
         Run only the Phase 4 of the SEAQT code (plotting).
+
+        :param background: If True, return immediately with a MATLAB FutureResult instead of blocking
+        :return: The MATLAB FutureResult if running in the background; None otherwise
         '''
-        self.matlab_engine.Phase4_Plot(nargout=0)
+        return self.matlab_engine.Phase4_Plot(nargout=0, background=background)
@@ -1,41 +1,40 @@
 import json
 import os
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from enum import IntEnum
-from shutil import copyfile
+from shutil import copyfile, copyfileobj
 import time
 from typing import Tuple
 from functools import partial
-from tkinter import *
+from threading import Thread
+from tkinter import CENTER, DISABLED, HORIZONTAL, N, NORMAL, NW, SOLID, W, X, DoubleVar, IntVar, StringVar, Tk, Toplevel
 from tkinter import ttk
-from tkinter import filedialog as fd
-from tkinter import messagebox
 from PIL import Image, ImageTk
-from zipfile import ZipFile
 
-from Frontend.MATLAB_Backend_Handler import MATLABBackendHandler
-from Frontend.Utils import clear_matlab_meta, clear_plots
+from Frontend.Utils import clear_matlab_meta, clear_plots, find_missing_files, write_prefs
 
 
 class PlotNumber(IntEnum):
     '''
     Enum to map plot name to a number for faster acquisition.
     '''
-    INVALID = -1,
-    UNKNOWN = 0,
-    ELECTRON_TEMPERATURE = 1,
-    ELECTRON_NUMBER = 2,
-    ELECTRON_ENERGY = 3,
-    ELECTRICAL_CONDUCTIVITY = 4,
-    SEEBECK_COEFFICIENT = 5,
-    PHONON_TEMPERATURE = 6,
-    PHONON_ENERGY = 7,
-    THERMAL_CONDUCTIVITY = 8,
-    ZT_FACTOR = 9,
-    DATA_NOT_LOADED = 400,
-    DATA_PROCESSING = 401,
-    DATA_PROCESSED_SUCCESSFULLY = 402,
-    DATA_LOADED_SUCCESSFULLY = 403,
+    INVALID = -1
+    UNKNOWN = 0
+    ELECTRON_TEMPERATURE = 1
+    ELECTRON_NUMBER = 2
+    ELECTRON_ENERGY = 3
+    ELECTRICAL_CONDUCTIVITY = 4
+    SEEBECK_COEFFICIENT = 5
+    PHONON_TEMPERATURE = 6
+    PHONON_ENERGY = 7
+    THERMAL_CONDUCTIVITY = 8
+    ZT_FACTOR = 9
+    DATA_NOT_LOADED = 400
+    DATA_PROCESSING = 401
+    DATA_PROCESSED_SUCCESSFULLY = 402
+    DATA_LOADED_SUCCESSFULLY = 403
     ERROR = 999
 
 
@@ -43,20 +42,20 @@ class TimeType(IntEnum):
     '''
     Enum to map time type to a number for faster acquisition.
     '''
-    INVALID = -1,
-    UNKNOWN = 0,
-    MIN = 1,
-    MAX = 2,
+    INVALID = -1
+    UNKNOWN = 0
+    MIN = 1
+    MAX = 2
 
 
 class RunType(IntEnum):
     '''
     Enum to map run type to a number for faster acquisition.
     '''
-    INVALID = -1,
-    UNKNOWN = 0,
-    ELECTRON = 1,
-    PHONON = 2,
+    INVALID = -1
+    UNKNOWN = 0
+    ELECTRON = 1
+    PHONON = 2
     BOTH = 3
 
 
@@ -64,10 +63,10 @@ class ExportType(IntEnum):
     '''
     Enum to map export type to a number for faster acquisition
     '''
-    INVALID = -1,
-    UNKNOWN = 0,
-    PLOT = 1,
-    DATA = 2,
+    INVALID = -1
+    UNKNOWN = 0
+    PLOT = 1
+    DATA = 2
     BOTH = 3
 
 
@@ -76,12 +75,37 @@ class SEAQTGui():
     GUI class for SEAQT handler.
     '''
 
+    # Fixed set of instance attributes (one GUI instance; no per-instance __dict__)
+    __slots__ = (
+        'backend', 'backend_future', 'block_check_buttons', 'block_input_selection_frame',
+        'block_master_frame', 'block_parameter_frame', 'block_plot_selection_frame',
+        'block_radio_buttons', 'block_sizes', 'block_temperatures', 'block_to_copy_from',
+        'block_variables', 'checkbox_frame', 'data_frame_image', 'data_frame_image_frame',
+        'decoded_image_cache', 'electron_dos_file_paths', 'electron_effective_masses',
+        'electron_ev_file_paths', 'electron_group_velocities', 'electron_relaxation_times',
+        'electron_tau_file_paths', 'error_figure_path', 'example_data_directory', 'export_button',
+        'export_directory',
+        'fermi_energies', 'figure_paths', 'file_executor', 'graph_export_buttons', 'input_json_dict',
+        'input_window', 'last_selected_directory', 'load_run_button', 'new_run_button', 'notebook', 'number_of_blocks',
+        'pending_plot_update', 'phonon_dos_file_paths', 'phonon_ev_file_paths',
+        'phonon_group_velocities', 'phonon_relaxation_times', 'phonon_tau_file_paths',
+        'plot_button', 'plot_checkbuttons', 'plot_image_cache', 'plot_radio_buttons',
+        'plot_variables', 'prefs_file_path', 'radio_button_frame', 'reset_button',
+        'right_menu_frame', 'run_type_buttons', 'save_button', 'selected_block_input',
+        'selected_blocks', 'selected_export_type', 'selected_plot', 'selected_plots',
+        'selected_run_type', 'selected_time_type', 'temp_directory', 'time_duration',
+        'time_radio_buttons', 'tkinter_root'
+    )
+
     # Class ('global') constants
     FRAME_PAD_X = 5
     FRAME_PAD_Y = 5
+    FRAME_GRID_OPTIONS = {'padx': FRAME_PAD_X, 'pady': FRAME_PAD_Y}
+    SECTION_FRAME_OPTIONS = {'padding': 5, 'relief': SOLID}
 
     ENTRY_PAD_X = 5
     ENTRY_PAD_Y = 2
+    ENTRY_GRID_OPTIONS = {'padx': ENTRY_PAD_X, 'pady': ENTRY_PAD_Y}
 
     LOAD_LAST_RUN_BUTTON_WIDTH = 50
 
@@ -95,6 +119,8 @@ class SEAQTGui():
         'seaqt_prefs.json'
     ]
 
+    SEAQT_RUN_CHUNK_SIZE = 1024 * 1024
+
     INPUT_FRAME_PAD_X = 15
     INPUT_FRAME_PAD_Y = 7
     INPUT_DATA_BUTTON_WIDTH = 10
@@ -120,8 +146,15 @@ class SEAQTGui():
     MENU_BUTTON_WIDTH = 10
     MENU_BUTTON_PAD_X = 5
     MENU_BUTTON_PAD_Y = 15
+    MENU_BUTTON_GRID_OPTIONS = {'padx': MENU_BUTTON_PAD_X, 'pady': MENU_BUTTON_PAD_Y}
 
     PLOT_BUTTON_PAD_Y = 3
+    PLOT_BUTTON_GRID_OPTIONS = {'pady': PLOT_BUTTON_PAD_Y, 'sticky': W}
+
+    EXPORT_MAX_WORKERS = 8
+
+    BACKEND_POLL_INTERVAL_MS = 100
+    PLOT_UPDATE_DELAY_MS = 80
 
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
@@ -147,10 +180,73 @@ class SEAQTGui():
 
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
+    # Base parameters as (prefs JSON key, class variable name)
+    BASE_PARAMETERS = (
+        ('number_of_blocks', 'number_of_blocks'),
+        ('run_type', 'selected_run_type'),
+        ('time_duration', 'time_duration'),
+        ('time_type', 'selected_time_type')
+    )
+
+    # Per-block parameters as (prefs JSON key, class variable name, variable type)
+    SHARED_BLOCK_PARAMETERS = (
+        ('block_sizes', 'block_sizes', DoubleVar),
+        ('block_temperatures', 'block_temperatures', DoubleVar),
+        ('fermi_energies', 'fermi_energies', DoubleVar)
+    )
+
+    ELECTRON_BLOCK_PARAMETERS = (
+        ('electron_ev_paths', 'electron_ev_file_paths', StringVar),
+        ('electron_dos_paths', 'electron_dos_file_paths', StringVar),
+        ('electron_tau_paths', 'electron_tau_file_paths', StringVar),
+        ('electron_group_velocities', 'electron_group_velocities', DoubleVar),
+        ('electron_relaxation_times', 'electron_relaxation_times', DoubleVar),
+        ('electron_effective_masses', 'electron_effective_masses', DoubleVar)
+    )
+
+    PHONON_BLOCK_PARAMETERS = (
+        ('phonon_ev_paths', 'phonon_ev_file_paths', StringVar),
+        ('phonon_dos_paths', 'phonon_dos_file_paths', StringVar),
+        ('phonon_tau_paths', 'phonon_tau_file_paths', StringVar),
+        ('phonon_group_velocities', 'phonon_group_velocities', DoubleVar),
+        ('phonon_relaxation_times', 'phonon_relaxation_times', DoubleVar)
+    )
+
+    # Per-block fields that must be filled in, as (prefs JSON key, field name); the tau files and electron group velocities are optional
+    REQUIRED_SHARED_FIELDS = (
+        ('block_sizes', 'Block Size'),
+        ('block_temperatures', 'Block Temperature'),
+        ('fermi_energies', 'Fermi Energy')
+    )
+
+    REQUIRED_ELECTRON_FIELDS = (
+        ('electron_ev_paths', 'Electron EV File Path'),
+        ('electron_dos_paths', 'Electron DOS File Path'),
+        ('electron_relaxation_times', 'Electron Relaxation Time'),
+        ('electron_effective_masses', 'Electron Effective Mass')
+    )
+
+    REQUIRED_PHONON_FIELDS = (
+        ('phonon_ev_paths', 'Phonon EV File Path'),
+        ('phonon_dos_paths', 'Phonon DOS File Path'),
+        ('phonon_group_velocities', 'Phonon Group Velocities'),
+        ('phonon_relaxation_times', 'Phonon Relaxation Time')
+    )
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
     TEMP_DIRECTORY_PATH = 'tmp'
     EXAMPLE_DATA_DIRECTORY_PATH = 'Example Data'
     PARAM_PREFERENCES_FILE_NAME = 'seaqt_prefs.json'
 
+    STATUS_PLOT_NUMBERS = (
+        PlotNumber.DATA_NOT_LOADED.value,
+        PlotNumber.DATA_PROCESSING.value,
+        PlotNumber.DATA_PROCESSED_SUCCESSFULLY.value,
+        PlotNumber.DATA_LOADED_SUCCESSFULLY.value,
+        PlotNumber.ERROR.value
+    )
+
     PLOT_NAMES = [
         'Electron Temperature',
         'Electron Number',
@@ -163,6 +259,25 @@ class SEAQTGui():
         'ZT Factor'
     ]
 
+    # Plots available to each run type
+    RUN_TYPE_PLOT_NUMBERS = {
+        RunType.ELECTRON.value: range(PlotNumber.ELECTRON_TEMPERATURE.value, PlotNumber.SEEBECK_COEFFICIENT.value + 1),
+        RunType.PHONON.value: range(PlotNumber.PHONON_TEMPERATURE.value, PlotNumber.PHONON_ENERGY.value + 1),
+        RunType.BOTH.value: range(PlotNumber.ELECTRON_TEMPERATURE.value, PlotNumber.ZT_FACTOR.value + 1)
+    }
+
+    # Radio button choices in the data input window, as (button text, value)
+    TIME_TYPE_OPTIONS = (
+        ('Min(tau)', TimeType.MIN.value),
+        ('Max(tau)', TimeType.MAX.value)
+    )
+
+    RUN_TYPE_OPTIONS = (
+        ('Electron', RunType.ELECTRON.value),
+        ('Phonon', RunType.PHONON.value),
+        ('Both', RunType.BOTH.value)
+    )
+
 
     def __init__(self):
         '''
@@ -174,8 +289,15 @@ class SEAQTGui():
                 os.makedirs(self.TEMP_DIRECTORY_PATH)
                 
             self.prefs_file_path = os.path.join(self.TEMP_DIRECTORY_PATH, self.PARAM_PREFERENCES_FILE_NAME)
+
+            # Absolute data directories, resolved once
+            self.temp_directory = os.path.abspath(self.TEMP_DIRECTORY_PATH)
+            self.example_data_directory = os.path.abspath(self.EXAMPLE_DATA_DIRECTORY_PATH)
+
+            # Imported here so a missing or broken MATLAB engine is reported like any other backend error
+            from Frontend.MATLAB_Backend_Handler import MATLABBackendHandler
             self.backend = MATLABBackendHandler(self.prefs_file_path)
-        except:
+        except Exception:
             self.pop_up_error('SEAQT Backend Encountered an Error.\n\nThis is likely due to a faulty or corrupted installation, but could also be an internal bug.\n\nPlease try again; if the problem persists, please open a ticket at https://github.com/azsprague/seaqt-gui/issues.')
             return
 
@@ -225,6 +347,12 @@ class SEAQTGui():
         self.block_input_selection_frame = None
         self.notebook = None
 
+        # Data input window (built on first use, then hidden / shown)
+        self.input_window = None
+
+        # Directory of the last file / directory chosen (file dialogs open there next time)
+        self.last_selected_directory = None
+
         # Selected blocks for plotting
         self.selected_blocks = None
         self.block_radio_buttons = None
@@ -232,6 +360,10 @@ class SEAQTGui():
         
         # JSON dictionary to be passed to the backend
         self.input_json_dict = {}
+        self.backend_future = None
+
+        # Worker for archive saves and loads (one at a time, off the Tk thread)
+        self.file_executor = ThreadPoolExecutor(max_workers=1)
 
         # Menu buttons (class variables)
         self.new_run_button = None
@@ -245,6 +377,11 @@ class SEAQTGui():
         self.selected_plot = IntVar(value=PlotNumber.INVALID.value)
         self.data_frame_image_frame = None
         self.data_frame_image = None
+        self.pending_plot_update = None
+        self.plot_image_cache = {}          # filenum -> (mtime, PhotoImage)
+        self.figure_paths = {plot_number.value: f'Figures/{plot_number.value}.png' for plot_number in PlotNumber if plot_number.value > 0}
+        self.error_figure_path = self.figure_paths[PlotNumber.ERROR.value]
+        self.decoded_image_cache = {}       # filenum -> (mtime, PIL Image), filled off the main thread
 
         self.time_radio_buttons = []
         
@@ -261,6 +398,9 @@ class SEAQTGui():
         self.graph_export_buttons = None
         self.selected_export_type = IntVar(value=ExportType.PLOT.value)
 
+        # Decode the static status images in the background
+        Thread(target=self.preload_plot_images, args=(self.STATUS_PLOT_NUMBERS,), daemon=True).start()
+
         # Run the GUI
         self.activate_main_window()
         self.tkinter_root.mainloop()
@@ -274,74 +414,18 @@ class SEAQTGui():
         menu_option_frame = ttk.LabelFrame(
             self.tkinter_root,
             text='Menu',
-            padding=5,
-            relief=SOLID
+            **self.SECTION_FRAME_OPTIONS
         )
         menu_option_frame.grid(column=0, row=0, padx=10, pady=10, sticky=N)
 
-        # New run button
-        self.new_run_button = ttk.Button(
-            menu_option_frame,
-            text='New',
-            command=self.activate_input_data_window,
-            width=self.MENU_BUTTON_WIDTH
-        )
-        self.new_run_button.grid(column=0, row=0, padx=self.MENU_BUTTON_PAD_X, pady=self.MENU_BUTTON_PAD_Y)
-
-        # Load run button
-        self.load_run_button = ttk.Button(
-            menu_option_frame,
-            text='Load',
-            command=self.load_previous_run,
-            width=self.MENU_BUTTON_WIDTH
-        )
-        self.load_run_button.grid(column=0, row=1, padx=self.MENU_BUTTON_PAD_X, pady=self.MENU_BUTTON_PAD_Y)
-
-        # Reset run button
-        self.reset_button = ttk.Button(
-            menu_option_frame,
-            text='Reset',
-            command=self.reset_data_process,
-            state=DISABLED,
-            width=self.MENU_BUTTON_WIDTH
-        )
-        self.reset_button.grid(column=0, row=2, padx=self.MENU_BUTTON_PAD_X, pady=self.MENU_BUTTON_PAD_Y)
-
-        # Save run button
-        self.save_button = ttk.Button(
-            menu_option_frame,
-            text='Save',
-            command=self.save_data,
-            state=DISABLED,
-            width=self.MENU_BUTTON_WIDTH
-        )
-        self.save_button.grid(column=0, row=3, padx=self.MENU_BUTTON_PAD_X, pady=self.MENU_BUTTON_PAD_Y)
-
-        # Export graphs button
-        self.export_button = ttk.Button(
-            menu_option_frame,
-            text='Export',
-            command=self.export_data,
-            state=DISABLED,
-            width=self.MENU_BUTTON_WIDTH
-        )
-        self.export_button.grid(column=0, row=4, padx=self.MENU_BUTTON_PAD_X, pady=self.MENU_BUTTON_PAD_Y)
-
-        # Help button
-        ttk.Button(
-            menu_option_frame,
-            text='Help',
-            command=self.activate_help_window,
-            width=self.MENU_BUTTON_WIDTH
-        ).grid(column=0, row=5, padx=self.MENU_BUTTON_PAD_X, pady=self.MENU_BUTTON_PAD_Y)
-
-        # Exit Button
-        ttk.Button(
-            menu_option_frame,
-            text='Exit',
-            command=self.exit_button,
-            width=self.MENU_BUTTON_WIDTH
-        ).grid(column=0, row=6, padx=self.MENU_BUTTON_PAD_X, pady=self.MENU_BUTTON_PAD_Y)
+        # Menu buttons (new and load start enabled; the rest wait for run data)
+        self.new_run_button = self.make_menu_button(menu_option_frame, 0, 'New', self.activate_input_data_window)
+        self.load_run_button = self.make_menu_button(menu_option_frame, 1, 'Load', self.load_previous_run)
+        self.reset_button = self.make_menu_button(menu_option_frame, 2, 'Reset', self.reset_data_process, DISABLED)
+        self.save_button = self.make_menu_button(menu_option_frame, 3, 'Save', self.save_data, DISABLED)
+        self.export_button = self.make_menu_button(menu_option_frame, 4, 'Export', self.export_data, DISABLED)
+        self.make_menu_button(menu_option_frame, 5, 'Help', self.activate_help_window)
+        self.make_menu_button(menu_option_frame, 6, 'Exit', self.exit_button)
 
         # # Copyright
         # ttk.Label(
@@ -369,8 +453,7 @@ class SEAQTGui():
         self.block_plot_selection_frame = ttk.LabelFrame(
             self.right_menu_frame,
             text='Blocks to Plot',
-            padding=5,
-            relief=SOLID
+            **self.SECTION_FRAME_OPTIONS
         )
         self.block_plot_selection_frame.grid(column=0, row=1, pady=5)
 
@@ -399,7 +482,7 @@ class SEAQTGui():
             # relief=SOLID,
             style='white.TFrame'
         )
-        data_view_frame.grid(column=1, row=0, padx=5, pady=5, sticky=N)
+        data_view_frame.grid(column=1, row=0, sticky=N, **self.FRAME_GRID_OPTIONS)
         data_view_frame.grid_propagate(False)
 
         # Create data image (default "no data loaded")
@@ -409,9 +492,33 @@ class SEAQTGui():
             justify=CENTER
         )
         self.data_frame_image_frame.place(relx=0.5, rely=0.5, anchor=CENTER)
-        self.update_plot(PlotNumber.DATA_NOT_LOADED.value)
+
+        # Show it once the window is up, giving the background decode (started in __init__) a head start
+        self.tkinter_root.after_idle(self.update_plot, PlotNumber.DATA_NOT_LOADED.value)
 
     
+    def make_menu_button(self, parent: ttk.LabelFrame, row: int, text: str, command, state: str = NORMAL) -> ttk.Button:
+        '''
+        Create and place one button of the main menu.
+
+        :param parent: The menu frame to create the button in
+        :param row: The grid row of the button
+        :param text: The button text
+        :param command: The function to call when the button is pressed
+        :param state: The initial state of the button (NORMAL or DISABLED)
+        :return: The created button
+        '''
+        button = ttk.Button(
+            parent,
+            text=text,
+            command=command,
+            state=state,
+            width=self.MENU_BUTTON_WIDTH
+        )
+        button.grid(column=0, row=row, **self.MENU_BUTTON_GRID_OPTIONS)
+        return button
+
+
     def update_plot_radio_buttons(self, enable: bool) -> None:
         '''
         (Re) create the radio buttons for the plot to display.
@@ -425,8 +532,7 @@ class SEAQTGui():
         self.radio_button_frame = ttk.LabelFrame(
             self.right_menu_frame,
             text='Select Plot',
-            padding=5,
-            relief=SOLID
+            **self.SECTION_FRAME_OPTIONS
         )
         self.radio_button_frame.grid(column=0, row=0, pady=5)
 
@@ -440,10 +546,10 @@ class SEAQTGui():
                 text=self.PLOT_NAMES[i],
                 variable=self.selected_plot,
                 value=i + 1,
-                command=partial(self.update_plot, i + 1),
+                command=self.on_plot_selected,
                 state=DISABLED
             )
-            rb.grid(column=0, row=i, pady=self.PLOT_BUTTON_PAD_Y, sticky=W)
+            rb.grid(column=0, row=i, **self.PLOT_BUTTON_GRID_OPTIONS)
             self.plot_radio_buttons.append(rb)
 
         # Reset plot selector
@@ -453,25 +559,8 @@ class SEAQTGui():
 
         # Update button states based on enable status and run type
         if enable:
-            run_type = self.selected_run_type.get()
-
-            # Enable electron buttons
-            if run_type == RunType.ELECTRON.value or run_type == RunType.BOTH.value:
-                self.plot_radio_buttons[0]['state'] = NORMAL
-                self.plot_radio_buttons[1]['state'] = NORMAL
-                self.plot_radio_buttons[2]['state'] = NORMAL
-                self.plot_radio_buttons[3]['state'] = NORMAL
-                self.plot_radio_buttons[4]['state'] = NORMAL
-
-            # Enable phonon buttons
-            if run_type == RunType.PHONON.value or run_type == RunType.BOTH.value:
-                self.plot_radio_buttons[5]['state'] = NORMAL
-                self.plot_radio_buttons[6]['state'] = NORMAL
-
-            # Enable combined buttons
-            if run_type == RunType.BOTH.value:
-                self.plot_radio_buttons[7]['state'] = NORMAL
-                self.plot_radio_buttons[8]['state'] = NORMAL
+            plot_numbers = self.RUN_TYPE_PLOT_NUMBERS.get(self.selected_run_type.get(), ())
+            self.set_widget_states(NORMAL, *(self.plot_radio_buttons[n - 1] for n in plot_numbers))
 
 
     def update_plot_check_buttons(self, enable: bool) -> None:
@@ -505,7 +594,7 @@ class SEAQTGui():
                 offvalue=0,
                 state=NORMAL if enable else DISABLED
             )
-            check_button.grid(column=(i // int((num_blocks / 2) + 0.5)) % 2, row=i % int((num_blocks / 2) + 0.5), padx=17, pady=self.PLOT_BUTTON_PAD_Y, sticky=W)
+            check_button.grid(column=(i // int((num_blocks / 2) + 0.5)) % 2, row=i % int((num_blocks / 2) + 0.5), padx=17, **self.PLOT_BUTTON_GRID_OPTIONS)
             self.block_check_buttons.append(check_button)
 
 
@@ -513,14 +602,31 @@ class SEAQTGui():
         '''
         Collect input data files and important parameters from the user.
         ''' 
-        # Create a new pop-up window and take control of input
-        input_window = Toplevel(self.tkinter_root)
-        input_window.title('Load Data and Set Parameters')
-        # input_window.resizable(False, False)
-        input_window.grab_set()
+        # Build the pop-up window once; afterwards, just show it again
+        if self.input_window is None or not self.input_window.winfo_exists():
+            self.input_window = Toplevel(self.tkinter_root)
+            self.input_window.title('Load Data and Set Parameters')
+            self.input_window.transient(self.tkinter_root)
+            # self.input_window.resizable(False, False)
+            self.input_window.protocol('WM_DELETE_WINDOW', self.hide_input_data_window)
+            self.build_input_data_window(self.input_window)
+        else:
+            # Rebuild only the per-block frames, which depend on the (possibly reset) block variables
+            self.update_number_of_blocks()
+            self.update_block_data_window()
+            self.input_window.deiconify()
+
+        # Take control of input (a grab can only be set once the window is viewable)
+        self.input_window.wait_visibility()
+        self.input_window.grab_set()
 
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
+    def build_input_data_window(self, input_window: Toplevel) -> None:
+        '''
+        Create the widgets of the data input window.
+
+        :param input_window: The window object for the data input screen
+        '''
         # Create master frame for base parameters
         top_window = ttk.Frame(
             input_window,
@@ -544,10 +650,9 @@ class SEAQTGui():
         base_parameter_input = ttk.LabelFrame(
             top_top_window,
             text='Base Parameters',
-            padding=5,
-            relief=SOLID
+            **self.SECTION_FRAME_OPTIONS
         )
-        base_parameter_input.grid(column=0, row=0, padx=5, pady=5)
+        base_parameter_input.grid(column=0, row=0, **self.FRAME_GRID_OPTIONS)
 
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
@@ -605,25 +710,16 @@ class SEAQTGui():
             justify=CENTER,
         ).grid(column=1, row=0)
 
-        # Radio button for min time
-        rb1 = ttk.Radiobutton(
-            time_parameter_frame,
-            text='Min(tau)',
-            variable=self.selected_time_type,
-            value=TimeType.MIN.value
-        )
-        rb1.grid(column=2, row=0, padx=2)
-        self.time_radio_buttons.append(rb1)
-
-        # Radio button for max time
-        rb2 = ttk.Radiobutton(
-            time_parameter_frame,
-            text='Max(tau)',
-            variable=self.selected_time_type,
-            value=TimeType.MAX.value
-        )
-        rb2.grid(column=3, row=0, padx=2)
-        self.time_radio_buttons.append(rb2) 
+        # Radio buttons for min / max time
+        for column, (button_text, time_type) in enumerate(self.TIME_TYPE_OPTIONS, start=2):
+            rb = ttk.Radiobutton(
+                time_parameter_frame,
+                text=button_text,
+                variable=self.selected_time_type,
+                value=time_type
+            )
+            rb.grid(column=column, row=0, padx=2)
+            self.time_radio_buttons.append(rb)
 
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
@@ -640,38 +736,17 @@ class SEAQTGui():
         )
         run_type_frame.grid(column=1, row=2)
 
-        # Electron radio button
-        electron_rb = ttk.Radiobutton(
-            run_type_frame,
-            text='Electron',
-            variable=self.selected_run_type,
-            command=self.update_block_data_window,
-            value=RunType.ELECTRON.value
-        )
-        electron_rb.grid(column=0, row=0, padx=2)
-        self.run_type_buttons.append(electron_rb)
-
-        # Phonon radio button
-        phonon_rb = ttk.Radiobutton(
-            run_type_frame,
-            text='Phonon',
-            variable=self.selected_run_type,
-            command=self.update_block_data_window,
-            value=RunType.PHONON.value
-        )
-        phonon_rb.grid(column=1, row=0, padx=2)
-        self.run_type_buttons.append(phonon_rb)
-
-        # Both radio button
-        both_rb = ttk.Radiobutton(
-            run_type_frame,
-            text='Both',
-            variable=self.selected_run_type,
-            command=self.update_block_data_window,
-            value=RunType.BOTH.value
-        )
-        both_rb.grid(column=2, row=0, padx=2)
-        self.run_type_buttons.append(both_rb)
+        # Electron / phonon / both radio buttons
+        for column, (button_text, run_type) in enumerate(self.RUN_TYPE_OPTIONS):
+            rb = ttk.Radiobutton(
+                run_type_frame,
+                text=button_text,
+                variable=self.selected_run_type,
+                command=self.update_block_data_window,
+                value=run_type
+            )
+            rb.grid(column=column, row=0, padx=2)
+            self.run_type_buttons.append(rb)
 
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ # 
 
@@ -679,16 +754,15 @@ class SEAQTGui():
         top_right_frame = ttk.Frame(
             top_top_window
         )
-        top_right_frame.grid(column=1, row=0, padx=5, pady=5, sticky=N)
+        top_right_frame.grid(column=1, row=0, sticky=N, **self.FRAME_GRID_OPTIONS)
 
         # Create info frame
         info_frame = ttk.LabelFrame(
             top_right_frame, 
             text='Info',
-            padding=5,
-            relief=SOLID
+            **self.SECTION_FRAME_OPTIONS
         )
-        info_frame.grid(column=0, row=0, padx=5, pady=5, sticky=N)
+        info_frame.grid(column=0, row=0, sticky=N, **self.FRAME_GRID_OPTIONS)
 
         # Info label
         ttk.Label(
@@ -714,7 +788,7 @@ class SEAQTGui():
             input_window,
             padding=5
         )
-        data_input_button_frame.grid(column=0, row=3, padx=5, pady=5)
+        data_input_button_frame.grid(column=0, row=3, **self.FRAME_GRID_OPTIONS)
 
         # Run button (all fields must be filled to confirm)
         ttk.Button(
@@ -731,6 +805,14 @@ class SEAQTGui():
         ).grid(column=1, row=0, padx=5)
 
 
+    def hide_input_data_window(self) -> None:
+        '''
+        Give back input control and hide the data input window (kept for reuse).
+        '''
+        self.input_window.grab_release()
+        self.input_window.withdraw()
+
+
     def import_default_settings(self) -> None:
         '''
         Use the default parameters for this run.
@@ -746,26 +828,15 @@ class SEAQTGui():
         self.update_block_data_window()
 
         # Prepare filepaths
-        example_data_directory = os.path.join(os.getcwd(), self.EXAMPLE_DATA_DIRECTORY_PATH)
-        
-        electron_ev_path = os.path.join(example_data_directory, self.DEFAULT_ELECTRON_EV_FILENAME)
-        if not os.path.isfile(electron_ev_path):
-            self.pop_up_error(f'Could not import default settings\n\nFile {self.DEFAULT_ELECTRON_EV_FILENAME} is missing or corrupted.')
-            return
-        
-        electron_dos_path = os.path.join(example_data_directory, self.DEFAULT_ELECTRON_DOS_FILENAME)
-        if not os.path.isfile(electron_dos_path):
-            self.pop_up_error(f'Could not import default settings\n\nFile {self.DEFAULT_ELECTRON_DOS_FILENAME} is missing or corrupted.')
-            return
-        
-        phonon_ev_path = os.path.join(example_data_directory, self.DEFAULT_PHONON_EV_FILENAME)
-        if not os.path.isfile(phonon_ev_path):
-            self.pop_up_error(f'Could not import default settings\n\nFile {self.DEFAULT_PHONON_EV_FILENAME} is missing or corrupted.')
-            return
-        
-        phonon_dos_path = os.path.join(example_data_directory, self.DEFAULT_PHONON_DOS_FILENAME)
-        if not os.path.isfile(phonon_dos_path):
-            self.pop_up_error(f'Could not import default settings\n\nFile {self.DEFAULT_PHONON_DOS_FILENAME} is missing or corrupted.')
+        electron_ev_path = os.path.join(self.example_data_directory, self.DEFAULT_ELECTRON_EV_FILENAME)
+        electron_dos_path = os.path.join(self.example_data_directory, self.DEFAULT_ELECTRON_DOS_FILENAME)
+        phonon_ev_path = os.path.join(self.example_data_directory, self.DEFAULT_PHONON_EV_FILENAME)
+        phonon_dos_path = os.path.join(self.example_data_directory, self.DEFAULT_PHONON_DOS_FILENAME)
+
+        # Ensure the example files exist (one directory listing for all four)
+        missing_files = find_missing_files([electron_ev_path, electron_dos_path, phonon_ev_path, phonon_dos_path])
+        if missing_files:
+            self.pop_up_error(f'Could not import default settings\n\nFile {os.path.basename(missing_files[0])} is missing or corrupted.')
             return
         
         # Update each block
@@ -859,7 +930,7 @@ class SEAQTGui():
             padding=10,
             relief=SOLID
         )
-        self.block_input_selection_frame.grid(column=0, row=0, padx=5, pady=5, sticky=N)
+        self.block_input_selection_frame.grid(column=0, row=0, sticky=N, **self.FRAME_GRID_OPTIONS)
 
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
@@ -889,10 +960,9 @@ class SEAQTGui():
         self.block_parameter_frame = ttk.LabelFrame(
             self.block_master_frame,
             text="Block Data and Parameters",
-            padding=5,
-            relief=SOLID
+            **self.SECTION_FRAME_OPTIONS
         )
-        self.block_parameter_frame.grid(column=1, row=0, padx=5, pady=5)
+        self.block_parameter_frame.grid(column=1, row=0, **self.FRAME_GRID_OPTIONS)
 
         block_index = self.selected_block_input.get() - 1
 
@@ -953,72 +1023,17 @@ class SEAQTGui():
 
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
-        # Block size label
-        ttk.Label(
-            param_input_frame,
-            text='Block Size',
-            width=20
-        ).grid(column=0, row=0)
-
-        # Block size text entry 
-        ttk.Entry(
-            param_input_frame,
-            textvariable=self.block_sizes[block_index],
-            width=15
-        ).grid(column=1, row=0, padx=self.ENTRY_PAD_X, pady=self.ENTRY_PAD_Y)
-
-        # Block size units
-        ttk.Label(
-            param_input_frame,
-            text='m',
-            width=20
-        ).grid(column=2, row=0)
-
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
-
-        # Block temperatures label
-        ttk.Label(
-            param_input_frame,
-            text='Block Temperature',
-            width=20
-        ).grid(column=0, row=1)
-
-        # Block temperatures text input 
-        ttk.Entry(
-            param_input_frame,
-            textvariable=self.block_temperatures[block_index],
-            width=15
-        ).grid(column=1, row=1, padx=self.ENTRY_PAD_X, pady=self.ENTRY_PAD_Y)  
-
-        # Block temperatures unit 
-        ttk.Label(
-            param_input_frame,
-            text='K',
-            width=20
-        ).grid(column=2, row=1)    
-
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
-
-        # Fermi energy label
-        ttk.Label(
-            param_input_frame,
-            text='Fermi Energy',
-            width=20
-        ).grid(column=0, row=2)
-
-        # Fermi energy text 
-        ttk.Entry(
+        # Block size, temperature, and fermi energy rows
+        self.build_parameter_input_rows(
             param_input_frame,
-            textvariable=self.fermi_energies[block_index],
-            width=15
-        ).grid(column=1, row=2, padx=self.ENTRY_PAD_X, pady=self.ENTRY_PAD_Y)
-
-        # Fermi energy unit  
-        ttk.Label(
-            param_input_frame,
-            text='eV  X  1.60218e-19 J',
-            width=20
-        ).grid(column=2, row=2)
+            (
+                ('Block Size', self.block_sizes, 'm'),
+                ('Block Temperature', self.block_temperatures, 'K'),
+                ('Fermi Energy', self.fermi_energies, 'eV  X  1.60218e-19 J')
+            ),
+            block_index,
+            20
+        )
 
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
@@ -1064,75 +1079,16 @@ class SEAQTGui():
 
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
-        # Electron ev file label
-        ttk.Label(
+        # Electron ev, dos, and tau file rows
+        self.build_file_input_rows(
             electron_file_input_frame,
-            text='Electron EV Data',
-            width=25
-        ).grid(column=0, row=0)
-
-        # Electron ev file text entry 
-        ttk.Entry(
-            electron_file_input_frame, 
-            textvariable=self.electron_ev_file_paths[block_index],
-            width=self.INPUT_DATA_ENTRY_WIDTH
-        ).grid(column=1, row=0, padx=self.ENTRY_PAD_X, pady=self.ENTRY_PAD_Y)
-
-        # Electron ev file browse button
-        ttk.Button(
-            electron_file_input_frame, 
-            text='Browse', 
-            command=partial(self.select_file, self.INPUT_DATA_FILETYPES, self.electron_ev_file_paths[block_index]),
-            width=self.INPUT_DATA_BUTTON_WIDTH,
-        ).grid(column=2, row=0, padx=5)
-
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
-
-        # Electron dos file label
-        ttk.Label(
-            electron_file_input_frame,
-            text='Electron DOS Data',
-            width=25
-        ).grid(column=0, row=1)
-
-        # Electron dos file text entry 
-        ttk.Entry(
-            electron_file_input_frame, 
-            textvariable=self.electron_dos_file_paths[block_index],
-            width=self.INPUT_DATA_ENTRY_WIDTH
-        ).grid(column=1, row=1, padx=self.ENTRY_PAD_X, pady=self.ENTRY_PAD_Y)
-
-        # Electron dos file browse button 
-        ttk.Button(
-            electron_file_input_frame, 
-            text='Browse', 
-            command=partial(self.select_file, self.INPUT_DATA_FILETYPES, self.electron_dos_file_paths[block_index]),
-            width=self.INPUT_DATA_BUTTON_WIDTH
-        ).grid(column=2, row=1, padx=5)
-
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
-
-        # Electron tau file label
-        ttk.Label(
-            electron_file_input_frame,
-            text='Electron Tau Data (optional)',
-            width=25
-        ).grid(column=0, row=2)
-
-        # Electron tau file text entry 
-        ttk.Entry(
-            electron_file_input_frame, 
-            textvariable=self.electron_tau_file_paths[block_index],
-            width=self.INPUT_DATA_ENTRY_WIDTH
-        ).grid(column=1, row=2, padx=self.ENTRY_PAD_X, pady=self.ENTRY_PAD_Y)
-
-        # Electron tau file browse button
-        ttk.Button(
-            electron_file_input_frame, 
-            text='Browse', 
-            command=partial(self.select_file, self.INPUT_DATA_FILETYPES, self.electron_tau_file_paths[block_index]),
-            width=self.INPUT_DATA_BUTTON_WIDTH
-        ).grid(column=2, row=2, padx=5)
+            (
+                ('Electron EV Data', self.electron_ev_file_paths),
+                ('Electron DOS Data', self.electron_dos_file_paths),
+                ('Electron Tau Data (optional)', self.electron_tau_file_paths)
+            ),
+            block_index
+        )
 
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
@@ -1145,72 +1101,17 @@ class SEAQTGui():
 
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
-        # Electron group velocities label
-        ttk.Label(
+        # Electron group velocity, relaxation time, and effective mass rows
+        self.build_parameter_input_rows(
             electron_parameter_input_frame,
-            text='Electron Group Velocities (optional)',
-            width=35
-        ).grid(column=0, row=0)
-
-        # Electron group velocities text entry 
-        ttk.Entry(
-            electron_parameter_input_frame,
-            textvariable=self.electron_group_velocities[block_index],
-            width=15
-        ).grid(column=1, row=0, padx=self.ENTRY_PAD_X, pady=self.ENTRY_PAD_Y)
-
-        # Electron group velocities unit
-        ttk.Label(
-            electron_parameter_input_frame,
-            text='m/s',
-            width=20
-        ).grid(column=2, row=0)
-
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
-
-        # Electron relaxation time label
-        ttk.Label(
-            electron_parameter_input_frame,
-            text='Electron Relaxation Time',
-            width=35
-        ).grid(column=0, row=1)
-
-        # Electron relaxation time text entry 
-        ttk.Entry(
-            electron_parameter_input_frame,
-            textvariable=self.electron_relaxation_times[block_index],
-            width=15
-        ).grid(column=1, row=1, padx=self.ENTRY_PAD_X, pady=self.ENTRY_PAD_Y)
-
-        # Electron relaxation time unit 
-        ttk.Label(
-            electron_parameter_input_frame,
-            text='s',
-            width=20
-        ).grid(column=2, row=1)
-
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
-
-        # Electron effective mass time label
-        ttk.Label(
-            electron_parameter_input_frame,
-            text='Electron Effective Mass',
-            width=35
-        ).grid(column=0, row=2)
-
-        # Electron effective mass time text entry 
-        ttk.Entry(
-            electron_parameter_input_frame,
-            textvariable=self.electron_effective_masses[block_index],
-            width=15
-        ).grid(column=1, row=2, padx=self.ENTRY_PAD_X, pady=self.ENTRY_PAD_Y)
-
-        # Electron effective mass time unit 
-        ttk.Label(
-            electron_parameter_input_frame,
-            text='X  9.109e-31 kg',
-            width=20
-        ).grid(column=2, row=2)
+            (
+                ('Electron Group Velocities (optional)', self.electron_group_velocities, 'm/s'),
+                ('Electron Relaxation Time', self.electron_relaxation_times, 's'),
+                ('Electron Effective Mass', self.electron_effective_masses, 'X  9.109e-31 kg')
+            ),
+            block_index,
+            35
+        )
 
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
@@ -1239,75 +1140,16 @@ class SEAQTGui():
 
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
-        # Phonon ev file label
-        ttk.Label(
-            phonon_file_input_frame,
-            text='Phonon EV Data',
-            width=25
-        ).grid(column=0, row=0)
-
-        # Phonon ev file text entry
-        ttk.Entry(
-            phonon_file_input_frame, 
-            textvariable=self.phonon_ev_file_paths[block_index],
-            width=self.INPUT_DATA_ENTRY_WIDTH
-        ).grid(column=1, row=0, padx=self.ENTRY_PAD_X, pady=self.ENTRY_PAD_Y)
-
-        # Phonon ev file browse button
-        ttk.Button(
-            phonon_file_input_frame, 
-            text='Browse', 
-            command=partial(self.select_file, self.INPUT_DATA_FILETYPES, self.phonon_ev_file_paths[block_index]),
-            width=self.INPUT_DATA_BUTTON_WIDTH
-        ).grid(column=2, row=0, padx=5)
-
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
-
-        # Phonon dos file label
-        ttk.Label(
-            phonon_file_input_frame,
-            text='Phonon DOS Data',
-            width=25
-        ).grid(column=0, row=1)
-
-        # Phonon dos file text entry
-        ttk.Entry(
-            phonon_file_input_frame, 
-            textvariable=self.phonon_dos_file_paths[block_index],
-            width=self.INPUT_DATA_ENTRY_WIDTH
-        ).grid(column=1, row=1, padx=self.ENTRY_PAD_X, pady=self.ENTRY_PAD_Y)
-
-        # Phonon dos file browse button
-        ttk.Button(
-            phonon_file_input_frame, 
-            text='Browse', 
-            command=partial(self.select_file, self.INPUT_DATA_FILETYPES, self.phonon_dos_file_paths[block_index]),
-            width=self.INPUT_DATA_BUTTON_WIDTH
-        ).grid(column=2, row=1, padx=5)
-
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
-
-        # Phonon tau file label
-        ttk.Label(
+        # Phonon ev, dos, and tau file rows
+        self.build_file_input_rows(
             phonon_file_input_frame,
-            text='Phonon Tau Data (optional)',
-            width=25
-        ).grid(column=0, row=2)
-
-        # Phonon tau file text entry
-        ttk.Entry(
-            phonon_file_input_frame, 
-            textvariable=self.phonon_tau_file_paths[block_index],
-            width=self.INPUT_DATA_ENTRY_WIDTH
-        ).grid(column=1, row=2, padx=self.ENTRY_PAD_X, pady=self.ENTRY_PAD_Y)
-
-        # Phonon tau file browse button
-        ttk.Button(
-            phonon_file_input_frame, 
-            text='Browse', 
-            command=partial(self.select_file, self.INPUT_DATA_FILETYPES, self.phonon_tau_file_paths[block_index]),
-            width=self.INPUT_DATA_BUTTON_WIDTH
-        ).grid(column=2, row=2, padx=5)
+            (
+                ('Phonon EV Data', self.phonon_ev_file_paths),
+                ('Phonon DOS Data', self.phonon_dos_file_paths),
+                ('Phonon Tau Data (optional)', self.phonon_tau_file_paths)
+            ),
+            block_index
+        )
 
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
@@ -1320,56 +1162,89 @@ class SEAQTGui():
 
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
-        # Phonon group velocities label
-        ttk.Label(
-            phonon_parameter_input_frame,
-            text='Phonon Group Velocities',
-            width=35
-        ).grid(column=0, row=0)
-
-        # Phonon group velocities text entry
-        ttk.Entry(
-            phonon_parameter_input_frame,
-            textvariable=self.phonon_group_velocities[block_index],
-            width=15
-        ).grid(column=1, row=0, padx=self.ENTRY_PAD_X, pady=self.ENTRY_PAD_Y)
-
-        # Phonon group velocities unit
-        ttk.Label(
+        # Phonon group velocity and relaxation time rows
+        self.build_parameter_input_rows(
             phonon_parameter_input_frame,
-            text='m/s',
-            width=20
-        ).grid(column=2, row=0)
+            (
+                ('Phonon Group Velocities', self.phonon_group_velocities, 'm/s'),
+                ('Phonon Relaxation Time', self.phonon_relaxation_times, 's')
+            ),
+            block_index,
+            35
+        )
 
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
-        # Phonon relaxation time label
-        ttk.Label(
-            phonon_parameter_input_frame,
-            text='Phonon Relaxation Time',
-            width=35
-        ).grid(column=0, row=1)
+        # Add the phonon master frame to the notebook
+        self.notebook.add(phonon_frame, text='Phonon Local System')
 
-        # Phonon relaxation time text entry
-        ttk.Entry(
-            phonon_parameter_input_frame,
-            textvariable=self.phonon_relaxation_times[block_index],
-            width=15
-        ).grid(column=1, row=1, padx=self.ENTRY_PAD_X, pady=self.ENTRY_PAD_Y)
+    
+    def build_file_input_rows(self, parent: ttk.Frame, rows: Tuple[Tuple[str, list]], block_index: int) -> None:
+        '''
+        Create a (label, path entry, browse button) row for each file input.
 
-        # Phonon relaxation time unit
-        ttk.Label(
-            phonon_parameter_input_frame,
-            text='s',
-            width=20
-        ).grid(column=2, row=1)
+        :param parent: The frame to create the rows in
+        :param rows: A tuple of (label text, list of StringVar) pairs, one per row
+        :param block_index: The index of the block whose file paths are shown
+        '''
+        for row, (label_text, file_paths) in enumerate(rows):
+
+            # File label
+            ttk.Label(
+                parent,
+                text=label_text,
+                width=25
+            ).grid(column=0, row=row)
+
+            # File path text entry
+            ttk.Entry(
+                parent,
+                textvariable=file_paths[block_index],
+                width=self.INPUT_DATA_ENTRY_WIDTH
+            ).grid(column=1, row=row, **self.ENTRY_GRID_OPTIONS)
+
+            # File browse button
+            ttk.Button(
+                parent,
+                text='Browse',
+                command=partial(self.select_file, self.INPUT_DATA_FILETYPES, file_paths[block_index]),
+                width=self.INPUT_DATA_BUTTON_WIDTH
+            ).grid(column=2, row=row, padx=5)
+
+
+    def build_parameter_input_rows(self, parent: ttk.Frame, rows: Tuple[Tuple[str, list, str]], block_index: int, label_width: int) -> None:
+        '''
+        Create a (label, value entry, unit label) row for each parameter input.
 
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+        :param parent: The frame to create the rows in
+        :param rows: A tuple of (label text, list of DoubleVar, unit text) triples, one per row
+        :param block_index: The index of the block whose parameters are shown
+        :param label_width: The width of the parameter labels
+        '''
+        for row, (label_text, variables, unit_text) in enumerate(rows):
+
+            # Parameter label
+            ttk.Label(
+                parent,
+                text=label_text,
+                width=label_width
+            ).grid(column=0, row=row)
+
+            # Parameter text entry
+            ttk.Entry(
+                parent,
+                textvariable=variables[block_index],
+                width=15
+            ).grid(column=1, row=row, **self.ENTRY_GRID_OPTIONS)
+
+            # Parameter unit
+            ttk.Label(
+                parent,
+                text=unit_text,
+                width=20
+            ).grid(column=2, row=row)
 
-        # Add the phonon master frame to the notebook
-        self.notebook.add(phonon_frame, text='Phonon Local System')
 
-    
     def copy_block_input(self) -> None:
         '''
         Copy block parameters from the block to copy from to the selected block
@@ -1403,13 +1278,29 @@ class SEAQTGui():
 
         :param window: The window object for the data input screen
         '''
-        self.number_of_blocks = IntVar(value=self.DEFAULT_NUM_BLOCKS)       # scalar
-        self.time_duration = DoubleVar(value=self.DEFAULT_TIME_DURATION)    # scalar
-        self.selected_time_type = IntVar(value=self.DEFAULT_TIME_TYPE)      # min or max
-        self.selected_run_type = IntVar(value=self.DEFAULT_RUN_TYPE)        # electron, phonon, or both
-        self.run_type_buttons = []
+        self.reset_input_data()
 
-        self.block_to_copy_from = IntVar(value=1)   # scalar 
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+        # Update the plotting buttons
+        self.update_plot_radio_buttons(False)
+        self.update_plot_check_buttons(False)
+
+        # Give back input control and hide the window
+        self.hide_input_data_window()
+
+
+    def reset_input_data(self) -> None:
+        '''
+        Reset all data fields to their defaults. The scalar variables are reset in place
+        so the (reused) data input window stays bound to them.
+        '''
+        self.number_of_blocks.set(self.DEFAULT_NUM_BLOCKS)      # scalar
+        self.time_duration.set(self.DEFAULT_TIME_DURATION)      # scalar
+        self.selected_time_type.set(self.DEFAULT_TIME_TYPE)     # min or max
+        self.selected_run_type.set(self.DEFAULT_RUN_TYPE)       # electron, phonon, or both
+
+        self.block_to_copy_from.set(1)  # scalar
 
         self.block_sizes = []                       # DoubleVar
         self.block_temperatures = []                # DoubleVar
@@ -1428,16 +1319,6 @@ class SEAQTGui():
         self.phonon_group_velocities = []           # DoubleVar
         self.phonon_relaxation_times = []           # DoubleVar
 
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
-
-        # Update the plotting buttons
-        self.update_plot_radio_buttons(False)
-        self.update_plot_check_buttons(False)
-
-        # Give back input control and close the window
-        window.grab_release()
-        window.destroy()
-
 
     def confirm_data_input_and_run(self, window: Toplevel) -> None:
         '''
@@ -1445,179 +1326,159 @@ class SEAQTGui():
 
         :param window: The window object for the data input screen
         '''
-        # Check base parameters
-        if not self.number_of_blocks.get() or not self.time_duration.get() or not self.selected_run_type.get():
-            self.pop_up_error('Please Complete All Fields\n\nMissing One or More Base Parameter')
-            return
-        
-        # Check block sizes
-        for block_size in self.block_sizes:
-            if not block_size or not block_size.get():
-                self.pop_up_error('Please Complete All Fields\n\nMissing One or More Block Size')
-                return
-            
-        # Check block temperatures
-        for block_temp in self.block_temperatures:
-            if not block_temp or not block_temp.get():
-                self.pop_up_error('Please Complete All Fields\n\nMissing One or More Block Temperature')
-                return
-            
-        # Check fermi energies
-        for energy in self.fermi_energies:
-            if not energy or not energy.get():
-                self.pop_up_error('Please Complete All Fields\n\nMissing One or More Fermi Energy')
-                return
+        # Read every input once; the values are checked here and then passed to the backend
+        input_values = self.collect_input_values()
+        run_type = input_values['run_type']
 
-        # Get the run type
-        run_type = self.selected_run_type.get()
+        # Input data file paths (all blocks) that must exist for this run type
+        file_paths = []
 
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+        # Required fields for this run type
+        required_fields = self.REQUIRED_SHARED_FIELDS
+        missing_fields = [] if all((input_values['number_of_blocks'], input_values['time_duration'], run_type)) else ['Base Parameter']
 
         # Check electron run parameters
-        if (run_type == RunType.ELECTRON.value or run_type == RunType.BOTH.value):
+        if run_type == RunType.ELECTRON.value or run_type == RunType.BOTH.value:
+            required_fields += self.REQUIRED_ELECTRON_FIELDS
+            file_paths += input_values['electron_ev_paths'] + input_values['electron_dos_paths'] + input_values['electron_tau_paths']
 
-            # Check electron ev filepaths
-            for file_path in self.electron_ev_file_paths:
-                if not file_path or not file_path.get() or file_path.get() == "":
-                    self.pop_up_error('Please Complete All Fields\n\nMissing One or More Electron EV File Path')
-                    return
-                
-            # Check electron dos filepaths
-            for file_path in self.electron_dos_file_paths:
-                if not file_path or not file_path.get() or file_path.get() == "":
-                    self.pop_up_error('Please Complete All Fields\n\nMissing One or More Electron DOS File Path')
-                    return
-                
-            # Check electron relaxation times
-            for relax_time in self.electron_relaxation_times:
-                if not relax_time or not relax_time.get():
-                    self.pop_up_error('Please Complete All Fields\n\nMissing One or More Electron Relaxation Time')
-                    return
-                
-            # Check electron effective masses
-            for effect_mass in self.electron_effective_masses:
-                if not effect_mass or not effect_mass.get():
-                    self.pop_up_error('Please Complete All Fields\n\nMissing One or More Electron Effective Mass')
-                    return
-                
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
-                
         # Check phonon run parameters
-        if (run_type == RunType.PHONON.value or run_type == RunType.BOTH.value):
+        if run_type == RunType.PHONON.value or run_type == RunType.BOTH.value:
+            required_fields += self.REQUIRED_PHONON_FIELDS
+            file_paths += input_values['phonon_ev_paths'] + input_values['phonon_dos_paths'] + input_values['phonon_tau_paths']
 
-            # Check phonon ev filepaths
-            for file_path in self.phonon_ev_file_paths:
-                if not file_path or not file_path.get() or file_path.get() == "":
-                    self.pop_up_error('Please Complete All Fields\n\nMissing One or More Phonon EV File Path')
-                    return
-                
-            # Check phonon dos filepaths
-            for file_path in self.phonon_dos_file_paths:
-                if not file_path or not file_path.get() or file_path.get() == "":
-                    self.pop_up_error('Please Complete All Fields\n\nMissing One or More Phonon DOS File Path')
-                    return
-                
-            # Check phonon group velocities
-            for velocity in self.phonon_group_velocities:
-                if not velocity or not velocity.get():
-                    self.pop_up_error('Please Complete All Fields\n\nMissing One or More Phonon Group Velocities')
-                    return
-            
-            # Check phonon relaxation times
-            for relax_time in self.phonon_relaxation_times:
-                if not relax_time or not relax_time.get():
-                    self.pop_up_error('Please Complete All Fields\n\nMissing One or More Phonon Relaxation Time')
-                    return
+        # Report every incomplete field at once
+        missing_fields += [field_name for json_key, field_name in required_fields if not all(input_values[json_key])]
+        if missing_fields:
+            self.pop_up_error('Please Complete All Fields\n\nMissing One or More:\n' + '\n'.join(missing_fields))
+            return
+
+        # Ensure every given file exists (blocks usually share files, so check each file once,
+        # however its path was spelled; e.g., browsed 'C:/dir/ev.xlsx' vs typed 'C:\dir\ev.xlsx')
+        unique_file_paths = {}
+        for path in file_paths:
+            if path:
+                unique_file_paths.setdefault(os.path.normcase(os.path.normpath(path)), path)
+        missing_files = find_missing_files(list(unique_file_paths.values()))
+        if missing_files:
+            self.file_not_found_error(missing_files[0])
+            return
             
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
-        # Give back input control and close the window
-        window.grab_release()
-        window.destroy()
+        # Give back input control and hide the window
+        self.hide_input_data_window()
 
         # Run the SEAQT backend
         self.update_plot(PlotNumber.DATA_PROCESSING.value)
-        self.start_data_process()
+        self.start_data_process(input_values)
 
 
-    def start_data_process(self) -> None:
-        '''
-        Run the SEAQT backend using the desired handler.
+    def collect_input_values(self) -> dict:
         '''
-        # Add base parameters
-        self.input_json_dict['number_of_blocks'] = self.number_of_blocks.get()
-        self.input_json_dict['time_duration'] = self.time_duration.get()
-        self.input_json_dict['time_type'] = self.selected_time_type.get()
-        self.input_json_dict['run_type'] = self.selected_run_type.get()
+        Read the current value of every input variable needed for the selected run type.
 
-        # Add shared parameters
-        self.input_json_dict['block_sizes'] = [x.get() for x in self.block_sizes]
-        self.input_json_dict['block_temperatures'] = [x.get() for x in self.block_temperatures]
-        self.input_json_dict['fermi_energies'] = [x.get() for x in self.fermi_energies]
-
-        # Get the run type
+        :return: A dictionary of input values, keyed as in the prefs JSON file
+        '''
         run_type = self.selected_run_type.get()
 
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+        # Base parameters
+        input_values = {
+            'number_of_blocks': self.number_of_blocks.get(),
+            'time_duration': self.time_duration.get(),
+            'time_type': self.selected_time_type.get(),
+            'run_type': run_type
+        }
 
-        # Add electron parameters
+        # Per-block parameters for the run type
+        block_parameters = self.SHARED_BLOCK_PARAMETERS
         if run_type == RunType.ELECTRON.value or run_type == RunType.BOTH.value:
+            block_parameters += self.ELECTRON_BLOCK_PARAMETERS
+        if run_type == RunType.PHONON.value or run_type == RunType.BOTH.value:
+            block_parameters += self.PHONON_BLOCK_PARAMETERS
 
-            self.input_json_dict['electron_ev_paths'] = [x.get() for x in self.electron_ev_file_paths]
-            self.input_json_dict['electron_dos_paths'] = [x.get() for x in self.electron_dos_file_paths]
-            self.input_json_dict['electron_tau_paths'] = [x.get() for x in self.electron_tau_file_paths]
+        for json_key, variable_name, _ in block_parameters:
+            input_values[json_key] = [variable.get() for variable in getattr(self, variable_name)]
 
-            self.input_json_dict['electron_group_velocities'] = [x.get() for x in self.electron_group_velocities]
-            self.input_json_dict['electron_relaxation_times'] = [x.get() for x in self.electron_relaxation_times]
-            self.input_json_dict['electron_effective_masses'] = [x.get() for x in self.electron_effective_masses]
+        return input_values
 
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
-        # Add phonon parameters
-        if run_type == RunType.PHONON.value or run_type == RunType.BOTH.value:
-            
-            self.input_json_dict['phonon_ev_paths'] = [x.get() for x in self.phonon_ev_file_paths]
-            self.input_json_dict['phonon_dos_paths'] = [x.get() for x in self.phonon_dos_file_paths]
-            self.input_json_dict['phonon_tau_paths'] = [x.get() for x in self.phonon_tau_file_paths]
+    def start_data_process(self, input_values: dict) -> None:
+        '''
+        Run the SEAQT backend using the desired handler.
 
-            self.input_json_dict['phonon_group_velocities'] = [x.get() for x in self.phonon_group_velocities]
-            self.input_json_dict['phonon_relaxation_times'] = [x.get() for x in self.phonon_relaxation_times]
+        :param input_values: The input values to pass to the backend (see collect_input_values)
+        '''
+        # Add the input values to the JSON object
+        self.input_json_dict.update(input_values)
+        run_type = input_values['run_type']
 
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
         # Write the JSON object to the prefs file
-        with open(self.prefs_file_path, 'w+') as prefs_file:
-            json.dump(self.input_json_dict, prefs_file)
+        write_prefs(self.prefs_file_path, self.input_json_dict)
+
+        # Block the new and load buttons while the backend runs
+        self.set_widget_states(DISABLED, self.new_run_button, self.load_run_button)
 
-        # Run the backend (NOTE: blocking)
+        # Start the backend in the background so the Tk event loop keeps running
         try:
             if run_type == RunType.ELECTRON.value:
-                self.backend.run_seaqt_electron_only()
+                self.backend_future = self.backend.run_seaqt_electron_only(background=True)
             elif run_type == RunType.PHONON.value:
-                self.backend.run_seaqt_phonon_only()
+                self.backend_future = self.backend.run_seaqt_phonon_only(background=True)
             elif run_type == RunType.BOTH.value:
-                self.backend.run_seaqt()
+                self.backend_future = self.backend.run_seaqt(background=True)
             else:
                 self.pop_up_error(f'Invalid Run Type: {run_type}.\n\nThis could be due to faulty input data or parameters; or due to an internal bug.\n\nPlease try again; if the problem persists, please open a ticket at https://github.com/azsprague/seaqt-gui/issues.')
-                self.update_plot(PlotNumber.ERROR.value)
+                self.finish_data_process(False)
                 return
-            
-            self.update_plot(PlotNumber.DATA_PROCESSED_SUCCESSFULLY.value)
-        except:
+        except Exception:
+            self.pop_up_error('SEAQT Backend Encountered an Error.\n\nThis could be due to faulty input data or parameters; or due to an internal bug.\n\nPlease try again; if the problem persists, please open a ticket at https://github.com/azsprague/seaqt-gui/issues.')
+            self.finish_data_process(False)
+            return
+
+        # Check back on the backend periodically
+        self.tkinter_root.after(self.BACKEND_POLL_INTERVAL_MS, self.poll_data_process)
+
+
+    def poll_data_process(self) -> None:
+        '''
+        Check whether the background SEAQT run has finished; reschedule until it has.
+        '''
+        if not self.backend_future.done():
+            self.tkinter_root.after(self.BACKEND_POLL_INTERVAL_MS, self.poll_data_process)
+            return
+
+        # Collect the result (re-raises any backend error)
+        try:
+            self.backend_future.result()
+        except Exception:
             self.pop_up_error('SEAQT Backend Encountered an Error.\n\nThis could be due to faulty input data or parameters; or due to an internal bug.\n\nPlease try again; if the problem persists, please open a ticket at https://github.com/azsprague/seaqt-gui/issues.')
+            self.finish_data_process(False)
+            return
+
+        self.finish_data_process(True)
+
+
+    def finish_data_process(self, success: bool) -> None:
+        '''
+        Update the plot and button states once a SEAQT run has ended.
+
+        :param success: True iff the backend completed without error
+        '''
+        self.backend_future = None
+
+        # On failure, show the error image and allow a new run or load
+        if not success:
             self.update_plot(PlotNumber.ERROR.value)
+            self.set_widget_states(NORMAL, self.new_run_button, self.load_run_button)
             return
-        
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
-        # Block the new and load buttons
-        self.new_run_button['state'] = DISABLED
-        self.load_run_button['state'] = DISABLED
+        self.update_plot(PlotNumber.DATA_PROCESSED_SUCCESSFULLY.value)
 
         # Unlock replot, reset, and save buttons
-        self.plot_button['state'] = NORMAL
-        self.reset_button['state'] = NORMAL
-        self.save_button['state'] = NORMAL
+        self.set_widget_states(NORMAL, self.plot_button, self.reset_button, self.save_button)
 
         # Update the plotting buttons
         self.update_plot_check_buttons(True)
@@ -1636,90 +1497,112 @@ class SEAQTGui():
             self.pop_up_error('No Archive File Selected')
             return
         
-        # Unpack and check the files
+        # Unpack the archive off the Tk thread; new and load stay disabled until it finishes
+        self.set_widget_states(DISABLED, self.new_run_button, self.load_run_button)
+        load_future = self.file_executor.submit(self.extract_run_archive, archive_file_path.get())
+        self.tkinter_root.after(self.BACKEND_POLL_INTERVAL_MS, self.poll_load_previous_run, load_future)
+
+
+    def extract_run_archive(self, filename: str) -> bytes:
+        '''
+        Unpack the run files of a SEAQT archive into the temp directory, one member per thread.
+
+        :param filename: Path of the archive to unpack
+        :return: The raw contents of the prefs file, as read from the archive
+        '''
+        with ThreadPoolExecutor(max_workers=len(self.SEAQT_RUN_FILENAMES)) as executor:
+            member_futures = {member_name: executor.submit(self.extract_run_archive_member, filename, member_name) for member_name in self.SEAQT_RUN_FILENAMES}
+            member_contents = {member_name: member_future.result() for member_name, member_future in member_futures.items()}
+
+        return member_contents[self.PARAM_PREFERENCES_FILE_NAME]
+
+
+    def extract_run_archive_member(self, filename: str, member_name: str) -> bytes:
+        '''
+        Unpack one member of a SEAQT archive into the temp directory (through its own archive handle).
+        The prefs file is small and is needed by the GUI as well, so it is read into memory and returned
+        instead of being read back from disk; the MATLAB data files are streamed.
+
+        :param filename: Path of the archive to unpack
+        :param member_name: Name of the member to unpack
+        :return: The member's contents if it is the prefs file, otherwise None
+        '''
+        with self.open_seaqt_archive(filename, 'r') as zf:
+            member_info = zf.getinfo(member_name)
+
+            if member_name == self.PARAM_PREFERENCES_FILE_NAME:
+                contents = zf.read(member_info)
+                with open(os.path.join(self.temp_directory, member_name), 'wb') as dst:
+                    dst.write(contents)
+                return contents
+
+            # Copy in blocks no larger than the member (an empty member just creates an empty file)
+            with zf.open(member_info, 'r') as src, open(os.path.join(self.temp_directory, member_name), 'wb') as dst:
+                copyfileobj(src, dst, min(member_info.file_size, self.SEAQT_RUN_CHUNK_SIZE))
+
+
+    def poll_load_previous_run(self, load_future) -> None:
+        '''
+        Check whether the background archive unpack has finished; reschedule until it has, then load the run.
+
+        :param load_future: The future of the extract_run_archive call
+        '''
+        if not load_future.done():
+            self.tkinter_root.after(self.BACKEND_POLL_INTERVAL_MS, self.poll_load_previous_run, load_future)
+            return
+
+        # Check the files were unpacked (any worker failure is reported, so new and load are never left disabled)
         try:
-            with ZipFile(archive_file_path.get(), 'r') as zf:
-                for filename in self.SEAQT_RUN_FILENAMES:
-                    zf.extract(filename, self.TEMP_DIRECTORY_PATH)
-        except:
-            self.pop_up_error('Failed to unpack SEAQT archive; data may be missing or corrupt.')
-            return    
-        
+            prefs_contents = load_future.result()
+        except Exception as e:
+            self.pop_up_error(f'Failed to unpack SEAQT archive; data may be missing or corrupt.\n\n{e}')
+            self.set_widget_states(NORMAL, self.new_run_button, self.load_run_button)
+            return
+
+        # Load JSON file (parsed from the archive contents; the unpacked copy is left for MATLAB)
+        try:
+            prefs_json = json.loads(prefs_contents)
+        except ValueError:
+            self.pop_up_error('Failed to read parameters from preferences file; data may be missing or corrupted.')
+            self.set_widget_states(NORMAL, self.new_run_button, self.load_run_button)
+            return
+
         # Copy relevant values from JSON file to class vairables
         try:
-            with open(self.prefs_file_path, 'r') as prefs_file:
-
-                # Load JSON file
-                prefs_json = json.load(prefs_file)
-                self.input_json_dict = prefs_json
-
-                # Extract global variables
-                num_blocks = prefs_json['number_of_blocks']
-                run_type = prefs_json['run_type']
-
-                self.number_of_blocks.set(num_blocks)
-                self.selected_run_type.set(run_type)
-                self.time_duration.set(prefs_json['time_duration'])
-                self.selected_time_type.set(prefs_json['time_type'])
-
-                # Reset global arrays
-                self.block_sizes = []                       # DoubleVar
-                self.block_temperatures = []                # DoubleVar
-                self.fermi_energies = []                    # DoubleVar
-
-                self.electron_ev_file_paths = []            # StringVar
-                self.electron_dos_file_paths = []           # StringVar
-                self.electron_tau_file_paths = []           # StringVar
-                self.electron_group_velocities = []         # DoubleVar
-                self.electron_relaxation_times = []         # DoubleVar
-                self.electron_effective_masses = []         # DoubleVar
-
-                self.phonon_ev_file_paths = []              # StringVar
-                self.phonon_dos_file_paths = []             # StringVar
-                self.phonon_tau_file_paths = []             # StringVar
-                self.phonon_group_velocities = []           # DoubleVar
-                self.phonon_relaxation_times = []           # DoubleVar
-
-                # Load each block's parameters
-                for i in range(num_blocks):
-
-                    # Shared parameters
-                    self.block_sizes.append(DoubleVar(value=prefs_json['block_sizes'][i]))
-                    self.block_temperatures.append(DoubleVar(value=prefs_json['block_temperatures'][i]))
-                    self.fermi_energies.append(DoubleVar(value=prefs_json['fermi_energies'][i]))
-
-                    # Electron-only parameters
-                    if run_type == RunType.ELECTRON.value or run_type == RunType.BOTH.value:
-
-                        self.electron_ev_file_paths.append(StringVar(value=prefs_json['electron_ev_paths'][i]))
-                        self.electron_dos_file_paths.append(StringVar(value=prefs_json['electron_dos_paths'][i]))
-                        self.electron_tau_file_paths.append(StringVar(value=prefs_json['electron_tau_paths'][i]))
-
-                        self.electron_group_velocities.append(DoubleVar(value=prefs_json['electron_group_velocities'][i]))
-                        self.electron_relaxation_times.append(DoubleVar(value=prefs_json['electron_relaxation_times'][i]))
-                        self.electron_effective_masses.append(DoubleVar(value=prefs_json['electron_effective_masses'][i]))
-
-                    # Phonon-only parameters
-                    if run_type == RunType.PHONON.value or run_type == RunType.BOTH.value:
-                        
-                        self.phonon_ev_file_paths.append(StringVar(value=prefs_json['phonon_ev_paths'][i]))
-                        self.phonon_dos_file_paths.append(StringVar(value=prefs_json['phonon_dos_paths'][i]))
-                        self.phonon_tau_file_paths.append(StringVar(value=prefs_json['phonon_tau_paths'][i]))
-
-                        self.phonon_group_velocities.append(DoubleVar(value=prefs_json['phonon_group_velocities'][i]))
-                        self.phonon_relaxation_times.append(DoubleVar(value=prefs_json['phonon_relaxation_times'][i]))
-        except:
+            self.input_json_dict = prefs_json
+
+            # Extract global variables
+            for json_key, variable_name in self.BASE_PARAMETERS:
+                getattr(self, variable_name).set(prefs_json[json_key])
+
+            num_blocks = prefs_json['number_of_blocks']
+            run_type = prefs_json['run_type']
+
+            # Collect the parameters relevant to this run type
+            block_parameters = self.SHARED_BLOCK_PARAMETERS
+            if run_type == RunType.ELECTRON.value or run_type == RunType.BOTH.value:
+                block_parameters += self.ELECTRON_BLOCK_PARAMETERS
+            if run_type == RunType.PHONON.value or run_type == RunType.BOTH.value:
+                block_parameters += self.PHONON_BLOCK_PARAMETERS
+
+            # Reset global arrays
+            for _, variable_name, _ in self.SHARED_BLOCK_PARAMETERS + self.ELECTRON_BLOCK_PARAMETERS + self.PHONON_BLOCK_PARAMETERS:
+                setattr(self, variable_name, [])
+
+            # Load each block's parameters
+            for json_key, variable_name, variable_type in block_parameters:
+                values = prefs_json[json_key]
+                setattr(self, variable_name, [variable_type(value=values[i]) for i in range(num_blocks)])
+        except (KeyError, IndexError, TypeError):
             self.pop_up_error('Failed to read parameters from preferences file; data may be missing or corrupted.')
+            self.set_widget_states(NORMAL, self.new_run_button, self.load_run_button)
             return
 
         # Disable new, load, and save buttons
-        self.new_run_button['state'] = DISABLED
-        self.load_run_button['state'] = DISABLED
-        self.save_button['state'] = DISABLED
+        self.set_widget_states(DISABLED, self.new_run_button, self.load_run_button, self.save_button)
 
         # Enable reset and plot buttons
-        self.reset_button['state'] = NORMAL
-        self.plot_button['state'] = NORMAL
+        self.set_widget_states(NORMAL, self.reset_button, self.plot_button)
 
         # Update the plotting buttons
         self.update_plot_radio_buttons(True)
@@ -1735,40 +1618,130 @@ class SEAQTGui():
 
         :param filenum: The number relating to the plot to show
         '''
+        # Reuse the decoded image unless the plot file has been regenerated since
+        image_path = self.figure_paths.get(filenum, self.error_figure_path)
         try:
-            # Open the desired image
-            loaded_image = Image.open(f'Figures/{filenum}.png')
-            # loaded_image = loaded_image.resize((600, 600), Image.NEAREST)
-            self.data_frame_image = ImageTk.PhotoImage(loaded_image)
+            image_mtime = os.path.getmtime(image_path)
+            cached_image = self.plot_image_cache.get(filenum)
 
-            if filenum > 0 and filenum < 10:
-                self.export_button['state'] = NORMAL
-        except:
+            if cached_image is not None and cached_image[0] == image_mtime:
+                self.data_frame_image = cached_image[1]
+            else:
+                # Use the background-decoded image if it is current, otherwise open and fully decode the desired image
+                decoded_image = self.decoded_image_cache.pop(filenum, None)
+                if decoded_image is not None and decoded_image[0] == image_mtime:
+                    self.data_frame_image = self.make_photo_image(decoded_image[1], cached_image)
+                else:
+                    with Image.open(image_path) as loaded_image:
+                        loaded_image.load()
+                        self.fit_plot_image(loaded_image)
+                        self.data_frame_image = self.make_photo_image(loaded_image, cached_image)
+                self.plot_image_cache[filenum] = (image_mtime, self.data_frame_image)
+        except OSError:
             try:
-                # An error occurred; try to open the error image
-                loaded_image = Image.open(f'Figures/{PlotNumber.ERROR.value}.png')
-                self.data_frame_image = ImageTk.PhotoImage(loaded_image)
-            except:
+                # An error occurred; show the error image (decoded once, then reused)
+                error_image = self.plot_image_cache.get(PlotNumber.ERROR.value)
+                if error_image is None:
+                    with Image.open(self.error_figure_path) as loaded_image:
+                        loaded_image.load()
+                        error_image = (os.path.getmtime(self.error_figure_path), ImageTk.PhotoImage(loaded_image))
+                    self.plot_image_cache[PlotNumber.ERROR.value] = error_image
+                self.data_frame_image = error_image[1]
+            except OSError:
                 # Error image could not be opened; display pop up error
                 self.pop_up_error('Failed to open image/plot. Data may be missing or corrupted.')
+        else:
+            if filenum > 0 and filenum < 10:
+                self.set_widget_states(NORMAL, self.export_button)
 
         # Set the image in the frame
         self.data_frame_image_frame.configure(image=self.data_frame_image, borderwidth=0)
 
 
+    def fit_plot_image(self, loaded_image: Image.Image) -> None:
+        '''
+        Shrink (in place, keeping the aspect ratio) an image larger than the data view frame,
+        so the plot is not clipped and Tk does not hold more pixels than are shown.
+
+        :param loaded_image: The decoded PIL image
+        '''
+        loaded_image.thumbnail((self.DATA_VIEW_FRAME_WIDTH, self.DATA_VIEW_FRAME_HEIGHT), Image.LANCZOS, reducing_gap=2.0)
+
+
+    def make_photo_image(self, loaded_image: Image.Image, cached_image: tuple) -> ImageTk.PhotoImage:
+        '''
+        Convert a decoded image for display, reusing the cached Tk image when the size is unchanged.
+
+        :param loaded_image: The decoded PIL image
+        :param cached_image: The (mtime, PhotoImage) cache entry for the plot, or None
+        :return: The PhotoImage holding the loaded image
+        '''
+        # loaded_image = loaded_image.resize((600, 600), Image.NEAREST)
+
+        # Regenerated plots keep their size; paste into the existing Tk image instead of allocating a new one
+        if cached_image is not None and (cached_image[1].width(), cached_image[1].height()) == loaded_image.size:
+            cached_image[1].paste(loaded_image)
+            return cached_image[1]
+        return ImageTk.PhotoImage(loaded_image)
+
+
+    def on_plot_selected(self) -> None:
+        '''
+        Show the plot chosen with the plot radio buttons.
+        '''
+        self.schedule_plot_update(self.selected_plot.get())
+
+
+    def schedule_plot_update(self, filenum: int) -> None:
+        '''
+        Update the central plot after a short delay, so rapid plot selections only draw the last one.
+
+        :param filenum: The number relating to the plot to show
+        '''
+        if self.pending_plot_update is not None:
+            self.tkinter_root.after_cancel(self.pending_plot_update)
+        self.pending_plot_update = self.tkinter_root.after(self.PLOT_UPDATE_DELAY_MS, self.run_pending_plot_update, filenum)
+
+
+    def run_pending_plot_update(self, filenum: int) -> None:
+        '''
+        Draw the plot scheduled by schedule_plot_update.
+
+        :param filenum: The number relating to the plot to show
+        '''
+        self.pending_plot_update = None
+        self.update_plot(filenum)
+
+
+    def preload_plot_images(self, filenums: Tuple[int]) -> None:
+        '''
+        Decode the given plot images ahead of time (safe to run off the Tk thread).
+        The PhotoImage objects themselves are still created by update_plot on the Tk thread.
+
+        :param filenums: The numbers relating to the plots to decode
+        '''
+        for filenum in filenums:
+            try:
+                image_path = self.figure_paths[filenum]
+                image_mtime = os.path.getmtime(image_path)
+                loaded_image = Image.open(image_path)
+                loaded_image.load()     # also closes the file
+                self.fit_plot_image(loaded_image)
+                self.decoded_image_cache[filenum] = (image_mtime, loaded_image)
+            except OSError:
+                pass
+
+
     def replot(self) -> bool:
         '''
         Replot with the new selected subsystems.
 
-        :return: True iff the plot was successful; false otherwise
+        :return: True iff the replot was started; false otherwise
         '''
         # Tally the selected subsystems
-        self.selected_blocks = []
-        for i in range(len(self.block_variables)):
-            if self.block_variables[i].get():
-                self.selected_blocks.append(i)
+        self.selected_blocks = [i for i, block_variable in enumerate(self.block_variables) if block_variable.get()]
 
-        if len(self.selected_blocks) == 0:
+        if not self.selected_blocks:
             self.pop_up_error('No Block(s) Selected. Please Choose at Least One.')
             return False
         
@@ -1776,40 +1749,77 @@ class SEAQTGui():
 
         # Write the JSON object to the prefs file
         try:
-            with open(self.prefs_file_path, 'w') as prefs_file:
-                json.dump(self.input_json_dict, prefs_file)
-        except:
+            write_prefs(self.prefs_file_path, self.input_json_dict)
+        except OSError:
             self.pop_up_error('Failed to modify preferences file; data may be missing or corrupted.')
             return False
 
-        # Replot
+        # Replot in the background. The plots and CSVs are rewritten in place, so everything that reads them
+        # (save, export, plot selection) is locked along with plot and reset until it finishes; only the
+        # widgets enabled now are re-enabled afterwards
+        if self.pending_plot_update is not None:
+            self.tkinter_root.after_cancel(self.pending_plot_update)
+            self.pending_plot_update = None
+        locked_widgets = [self.plot_button, self.reset_button] + [
+            widget for widget in (self.save_button, self.export_button, *self.plot_radio_buttons) if widget.instate(['!disabled'])
+        ]
+        self.set_widget_states(DISABLED, *locked_widgets)
         try:
-            self.backend.generate_plot()
+            self.backend_future = self.backend.generate_plot(background=True)
+        except Exception:
+            self.pop_up_error('SEAQT Backend Encountered an Error.\n\nThis could be due to faulty input data or parameters; or due to an internal bug.\n\nPlease try again; if the problem persists, please open a ticket at https://github.com/azsprague/seaqt-gui/issues.')
+            self.set_widget_states(NORMAL, *locked_widgets)
+            return False
+
+        self.tkinter_root.after(self.BACKEND_POLL_INTERVAL_MS, self.poll_replot, locked_widgets)
+        return True
 
-            run_type = self.selected_run_type.get()
-            if run_type == RunType.ELECTRON.value or run_type == RunType.BOTH.value:
-                self.selected_plot.set(PlotNumber.ELECTRON_TEMPERATURE.value)
-            elif run_type == RunType.PHONON.value:
-                self.selected_plot.set(PlotNumber.PHONON_TEMPERATURE.value)
-            else:
-                self.pop_up_error(f'Invalid Run Type: {run_type}.\n\nThis could be due to faulty input data or parameters; or due to an internal bug.\n\nPlease try again; if the problem persists, please open a ticket at https://github.com/azsprague/seaqt-gui/issues.')
-                return False
 
-            self.update_plot(self.selected_plot.get())
-        except:
+    def poll_replot(self, locked_widgets: list) -> None:
+        '''
+        Check whether the background replot has finished; reschedule until it has, then show the new plots.
+
+        :param locked_widgets: The widgets disabled by replot, to re-enable once it has finished
+        '''
+        if not self.backend_future.done():
+            self.tkinter_root.after(self.BACKEND_POLL_INTERVAL_MS, self.poll_replot, locked_widgets)
+            return
+
+        self.set_widget_states(NORMAL, *locked_widgets)
+
+        # Collect the result (re-raises any backend error)
+        try:
+            self.backend_future.result()
+        except Exception:
             self.pop_up_error('SEAQT Backend Encountered an Error.\n\nThis could be due to faulty input data or parameters; or due to an internal bug.\n\nPlease try again; if the problem persists, please open a ticket at https://github.com/azsprague/seaqt-gui/issues.')
-            return False
+            return
+        finally:
+            self.backend_future = None
+
+        run_type = self.selected_run_type.get()
+        if run_type == RunType.ELECTRON.value or run_type == RunType.BOTH.value:
+            self.selected_plot.set(PlotNumber.ELECTRON_TEMPERATURE.value)
+        elif run_type == RunType.PHONON.value:
+            self.selected_plot.set(PlotNumber.PHONON_TEMPERATURE.value)
+        else:
+            self.pop_up_error(f'Invalid Run Type: {run_type}.\n\nThis could be due to faulty input data or parameters; or due to an internal bug.\n\nPlease try again; if the problem persists, please open a ticket at https://github.com/azsprague/seaqt-gui/issues.')
+            return
+
+        self.update_plot(self.selected_plot.get())
+
+        # Decode the remaining plots in the background so switching to them is quick
+        remaining_plot_numbers = tuple(plot_number for plot_number in self.RUN_TYPE_PLOT_NUMBERS[run_type] if plot_number != self.selected_plot.get())
+        Thread(target=self.preload_plot_images, args=(remaining_plot_numbers,), daemon=True).start()
 
         # Update plotting buttons
         self.update_plot_radio_buttons(True)
 
-        return True
-
 
     def reset_data_process(self) -> None:
         '''
         Resets all stored / calculated data.
         '''
+        from tkinter import messagebox
         user_choice = messagebox.askyesno(
             title='WARNING',
             message='You are about to erase all data and reset inputs to defaults. Do you wish to proceed?'
@@ -1818,30 +1828,7 @@ class SEAQTGui():
         # If user selects 'YES', reset all values
         if user_choice:
 
-            self.number_of_blocks = IntVar(value=self.DEFAULT_NUM_BLOCKS)       # scalar
-            self.time_duration = DoubleVar(value=self.DEFAULT_TIME_DURATION)    # scalar
-            self.selected_time_type = IntVar(value=self.DEFAULT_TIME_TYPE)      # min or max
-            self.selected_run_type = IntVar(value=self.DEFAULT_RUN_TYPE)        # electron, phonon, or both
-            self.run_type_buttons = []
-
-            self.block_to_copy_from = IntVar(value=1)   # scalar 
-
-            self.block_sizes = []                       # DoubleVar
-            self.block_temperatures = []                # DoubleVar
-            self.fermi_energies = []                    # DoubleVar
-
-            self.electron_ev_file_paths = []            # StringVar
-            self.electron_dos_file_paths = []           # StringVar
-            self.electron_tau_file_paths = []           # StringVar
-            self.electron_group_velocities = []         # DoubleVar
-            self.electron_relaxation_times = []         # DoubleVar
-            self.electron_effective_masses = []         # DoubleVar
-
-            self.phonon_ev_file_paths = []              # StringVar
-            self.phonon_dos_file_paths = []             # StringVar
-            self.phonon_tau_file_paths = []             # StringVar
-            self.phonon_group_velocities = []           # DoubleVar
-            self.phonon_relaxation_times = []           # DoubleVar
+            self.reset_input_data()
 
             # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
@@ -1853,17 +1840,18 @@ class SEAQTGui():
             self.update_plot(PlotNumber.DATA_NOT_LOADED.value)
 
             # Enable new and load buttons, disable reset, save, and export buttons
-            self.new_run_button['state'] = NORMAL
-            self.load_run_button['state'] = NORMAL
-            self.reset_button['state'] = DISABLED
-            self.save_button['state'] = DISABLED
-            self.export_button['state'] = DISABLED
+            self.set_widget_states(NORMAL, self.new_run_button, self.load_run_button)
+            self.set_widget_states(DISABLED, self.reset_button, self.save_button, self.export_button)
 
             # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
-            # Remove any old plots
+            # Remove any old plots (and their cached images; the status images are kept)
             clear_matlab_meta()
             clear_plots()
+            for filenum in self.figure_paths:
+                if filenum not in self.STATUS_PLOT_NUMBERS:
+                    self.plot_image_cache.pop(filenum, None)
+                    self.decoded_image_cache.pop(filenum, None)
 
 
     def save_data(self) -> None:
@@ -1871,6 +1859,7 @@ class SEAQTGui():
         Save the run data (.mat files and .json file) to be used for later plotting.
         '''
         # Have the user select a filename to save as
+        from tkinter import filedialog as fd
         filename = fd.asksaveasfilename(
             title='Save SEAQT Data',
             defaultextension='.seaqt',
@@ -1883,20 +1872,79 @@ class SEAQTGui():
             self.pop_up_error('No Archive File Selected')
             return
         
-        # Create the archive file and save
-        temp_dir = os.path.join(os.getcwd(), self.TEMP_DIRECTORY_PATH)
+        # Create the archive file off the Tk thread; save, reset, and replot stay disabled until it finishes
+        # (new and load are already disabled while a run is loaded)
+        self.set_widget_states(DISABLED, self.save_button, self.reset_button, self.plot_button)
+        save_future = self.file_executor.submit(self.write_run_archive, filename)
+        self.tkinter_root.after(self.BACKEND_POLL_INTERVAL_MS, self.poll_save_data, save_future)
+
+
+    @contextmanager
+    def open_seaqt_archive(self, filename: str, mode: str):
+        '''
+        Open a SEAQT archive (members stored uncompressed) on top of a file with a large buffer,
+        so the central directory scan and member I/O use few system calls.
+
+        :param filename: Path of the archive
+        :param mode: 'r' to read or 'w' to write
+        :return: Context manager yielding the ZipFile
+        '''
+        # zipfile is only needed to save or load a run, so it is not imported at startup
+        from zipfile import ZipFile, ZIP_STORED
+
+        with open(filename, mode + 'b', buffering=self.SEAQT_RUN_CHUNK_SIZE) as archive_file, ZipFile(archive_file, mode, compression=ZIP_STORED) as zf:
+            yield zf
+
+
+    def write_run_archive(self, filename: str) -> None:
+        '''
+        Write the run data to a SEAQT archive. The archive is built next to the destination
+        and moved into place once complete, so an existing file is never left half-written.
+
+        :param filename: Path of the archive to create
+        '''
+        from zipfile import ZipInfo
+
+        temp_filename = filename + '.tmp'
         try:
-            with ZipFile(filename, 'w') as zf:
-                for filename in self.SEAQT_RUN_FILENAMES:
-                    zf.write(os.path.join(temp_dir, filename), filename)
+            with self.open_seaqt_archive(temp_filename, 'w') as zf:
+                for member_name in self.SEAQT_RUN_FILENAMES:
+                    member_path = os.path.join(self.temp_directory, member_name)
+                    member_info = ZipInfo.from_file(member_path, member_name)
+                    member_info.compress_type = zf.compression
+                    with open(member_path, 'rb') as src, zf.open(member_info, 'w') as dst:
+                        copyfileobj(src, dst, self.SEAQT_RUN_CHUNK_SIZE)
+            os.replace(temp_filename, filename)
+        except Exception:
+            try:
+                os.remove(temp_filename)
+            except OSError:
+                pass
+            raise
+
+
+    def poll_save_data(self, save_future) -> None:
+        '''
+        Check whether the background archive write has finished; reschedule until it has.
+
+        :param save_future: The future of the write_run_archive call
+        '''
+        if not save_future.done():
+            self.tkinter_root.after(self.BACKEND_POLL_INTERVAL_MS, self.poll_save_data, save_future)
+            return
+
+        self.set_widget_states(NORMAL, self.save_button, self.reset_button, self.plot_button)
+
+        # Inform the user whether the data has been saved; any failure in the worker is reported here,
+        # since an exception escaping this after() callback would never reach the user
+        try:
+            save_future.result()
         except Exception as e:
-            self.pop_up_error('Failed to create SEAQT archive')
-            print(e)
+            self.pop_up_error(f'Failed to create SEAQT archive\n\n{e}')
             return
-        
-        # Inform the user the data has been saved
+
         self.pop_up_info('SEAQT Run Saved Successfully.')
-        
+
 
     def export_data(self) -> None:
         '''
@@ -1946,7 +1994,7 @@ class SEAQTGui():
             text='Select Graph(s) to Export',
             padding=15
         )
-        plot_select_frame.grid(column=0, row=1, padx=5, pady=5)
+        plot_select_frame.grid(column=0, row=1, **self.FRAME_GRID_OPTIONS)
 
         # Create checkbuttons for each plot
         num_of_plots = len(self.PLOT_NAMES)
@@ -2016,7 +2064,7 @@ class SEAQTGui():
             export_window,
             padding=10
         )
-        button_frame.grid(column=0, row=3, padx=5, pady=5)
+        button_frame.grid(column=0, row=3, **self.FRAME_GRID_OPTIONS)
 
         ttk.Button(
             button_frame,
@@ -2058,32 +2106,34 @@ class SEAQTGui():
         successful_exports = []
         failed_exports = []
 
+        export_directory = self.export_directory.get()
+        export_type = self.selected_export_type.get()
+        export_jobs = []
+
         # Export plots if "Plot" or "Both" is chosen
-        if self.selected_export_type.get() == ExportType.PLOT.value or self.selected_export_type.get() == ExportType.BOTH.value:
-        
+        if export_type == ExportType.PLOT.value or export_type == ExportType.BOTH.value:
             for plot_number in self.selected_plots:
-                try:
-                    copyfile(f'Figures/{plot_number + 1}.png', os.path.join(self.export_directory.get(), f'{self.PLOT_NAMES[plot_number]}_{curr_time}.png'))
-                    successful_exports.append(plot_number)
-                except Exception as e:
-                    print(e)
-                    failed_exports.append(plot_number)
+                export_jobs.append((plot_number, self.figure_paths[plot_number + 1], os.path.join(export_directory, f'{self.PLOT_NAMES[plot_number]}_{curr_time}.png')))
 
         # Export data if "Data" or "Both" is chosen
-        if self.selected_export_type.get() == ExportType.DATA.value or self.selected_export_type.get() == ExportType.BOTH.value:
-
+        if export_type == ExportType.DATA.value or export_type == ExportType.BOTH.value:
             for plot_number in self.selected_plots:
+                export_jobs.append((plot_number, os.path.join(self.temp_directory, f'{plot_number + 1}.csv'), os.path.join(export_directory, f'{self.PLOT_NAMES[plot_number]}_{curr_time}.csv')))
+
+        # Copy the files concurrently (each copy is independent and I/O bound)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.EXPORT_MAX_WORKERS, len(export_jobs)))) as executor:
+            futures = {executor.submit(copyfile, src, dst): (plot_number, dst) for plot_number, src, dst in export_jobs}
+            for future, (plot_number, dst) in futures.items():
                 try:
-                    copyfile(f'tmp/{plot_number + 1}.csv', os.path.join(self.export_directory.get(), f'{self.PLOT_NAMES[plot_number]}_{curr_time}.csv'))
+                    future.result()
                     successful_exports.append(plot_number)
                 except Exception as e:
-                    print(e)
-                    failed_exports.append(plot_number)
+                    failed_exports.append(f'{os.path.basename(dst)}: {e}')
 
-        # Check for failed exports
+        # Check for failed exports (list each failed file with its error)
         num_failed_exports = len(failed_exports)
         if num_failed_exports > 0:
-            self.pop_up_error(f"Failed to export {num_failed_exports} files{'s' if num_failed_exports > 1 else ''}\n\nData may be missing or corrupted, or there may be an internal bug.\n\nPlease try again; if the problem persists, please open a ticket at https://github.com/azsprague/seaqt-gui/issues.")
+            self.pop_up_error(f"Failed to export {num_failed_exports} file{'s' if num_failed_exports > 1 else ''}:\n\n" + '\n'.join(failed_exports) + "\n\nData may be missing or corrupted, or there may be an internal bug.\n\nPlease try again; if the problem persists, please open a ticket at https://github.com/azsprague/seaqt-gui/issues.")
             return
 
         # Release control and close the window
@@ -2127,6 +2177,7 @@ class SEAQTGui():
         '''
         Ask the user if they are sure, then exit.
         '''
+        from tkinter import messagebox
         user_choice = messagebox.askyesno(
             title='WARNING',
             message='Are you sure you want to exit? Any unsaved data will be lost.'
@@ -2141,30 +2192,52 @@ class SEAQTGui():
             return
         
 
+    def set_widget_states(self, state: str, *widgets) -> None:
+        '''
+        Set the state of each given widget.
+
+        :param state: The state to set (NORMAL or DISABLED)
+        :param widgets: The widgets to update
+        '''
+        for widget in widgets:
+            widget.configure(state=state)
+
+
     def select_file(self, filetypes: Tuple[Tuple[str, str]], global_file_path: StringVar) -> None:
         '''
         Open a filesystem window to allow the user to choose a file.
 
         :param filetypes: A tuple of tuples containing (description, filetype)'s, e.g., ('text files', '*.txt')
-        :param global_file_path: StringVar to contain the chosen file path
+        :param global_file_path: StringVar to contain the chosen file path (left unchanged if the dialog is cancelled)
         '''
+        # File dialogs are only needed once the user browses, so filedialog is not imported at startup
+        from tkinter import filedialog as fd
+
+        # Start in the directory of the current path, if any; otherwise where the last file was chosen
         filename = fd.askopenfilename(
             title='Select a File',
-            filetypes=filetypes
+            filetypes=filetypes,
+            initialdir=os.path.dirname(global_file_path.get()) or self.last_selected_directory
         )
-        global_file_path.set(filename)
+        if filename:
+            self.last_selected_directory = os.path.dirname(filename)
+            global_file_path.set(filename)
 
 
     def select_directory(self, global_directory_path: StringVar) -> None:
         '''
         Open a filesystem window to allow the user to choose a directory.
 
-        :param global_directory_path: StringVar to contain the chosen directory path
+        :param global_directory_path: StringVar to contain the chosen directory path (left unchanged if the dialog is cancelled)
         '''
+        from tkinter import filedialog as fd
         directory = fd.askdirectory(
-            title='Select a Directory / Folder'
+            title='Select a Directory / Folder',
+            initialdir=global_directory_path.get() or self.last_selected_directory
         )
-        global_directory_path.set(directory)
+        if directory:
+            self.last_selected_directory = directory
+            global_directory_path.set(directory)
 
     
     def feature_not_implemented_error(self) -> None:
@@ -2189,6 +2262,7 @@ class SEAQTGui():
 
         :param message: The message to present the user
         '''
+        from tkinter import messagebox
         messagebox.showerror(
             title='ERROR',
             message=error_message
@@ -2201,6 +2275,7 @@ class SEAQTGui():
 
         :param message: The message to present the user
         '''
+        from tkinter import messagebox
         messagebox.showinfo(
             title='INFO',
             message=info_message
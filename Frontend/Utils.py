@@ -1,33 +1,49 @@
-import glob
+import json
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 PARAM_PREFERENCES_FILE_NAME = 'seaqt_prefs.json'
 
+# Last payload written to each prefs file, with the file's mtime (ns) just after the write
+_written_prefs = {}
+
 def clear_plots():
     '''
     Erase all plots from previous run(s).
+    The figures directory is listed once and only the plots that actually exist are removed.
     '''
-    for i in range(1, 10):
-        try:
-            os.remove(f'Figures/{i}.png')
-        except:
-            pass
+    plot_names = {f'{i}.png' for i in range(1, 10)}
+    _remove_matching_files('Figures', lambda name: name in plot_names)
 
 def clear_matlab_meta():
     '''
     Erase any files leftover from MATLAB run(s).
     '''
-    for mat in glob.glob('tmp/*.mat'):
-        try:
-            os.remove(mat)
-        except:
-            pass
+    _remove_matching_files('tmp', lambda name: name.endswith(('.mat', '.csv')))
 
-    for csv in glob.glob('tmp/*.csv'):
-        try:
-            os.remove(csv)
-        except:
-            pass
+def _remove_matching_files(directory: str, matches):
+    '''
+    Remove the regular files in a directory whose names match, in a single directory scan.
+
+    :param directory: Directory to scan
+    :param matches: Predicate taking a file name and returning whether to remove it
+    '''
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            if matches(entry.name) and entry.is_file():
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
 
 def clear_prefs():
     '''
@@ -35,5 +51,69 @@ def clear_prefs():
     '''
     try:
         os.remove(PARAM_PREFERENCES_FILE_NAME)
-    except:
+    except OSError:
         pass
+
+def write_prefs(prefs_file_path: str, prefs: dict):
+    '''
+    Serialize the prefs dictionary and write it to the given file in a single write.
+    Uses orjson when it is installed; otherwise falls back to the standard json module.
+    The data is written to a sibling temporary file and then moved over the prefs file,
+    so an interrupted write never leaves a truncated prefs file behind.
+    The write is skipped if the file still holds exactly the payload last written to it.
+
+    :param prefs_file_path: Path to the prefs file to (over)write
+    :param prefs: JSON-serializable dictionary of SEAQT inputs and parameters
+    '''
+    if orjson is not None:
+        payload = orjson.dumps(prefs)
+    else:
+        payload = json.dumps(prefs, separators=(',', ':')).encode()
+
+    last_written = _written_prefs.get(prefs_file_path)
+    if last_written is not None and last_written[0] == payload:
+        try:
+            if os.stat(prefs_file_path).st_mtime_ns == last_written[1]:
+                return
+        except OSError:
+            pass
+
+    temp_file_path = prefs_file_path + '.tmp'
+    with open(temp_file_path, 'wb') as prefs_file:
+        prefs_file.write(payload)
+
+    os.replace(temp_file_path, prefs_file_path)
+    _written_prefs[prefs_file_path] = (payload, os.stat(prefs_file_path).st_mtime_ns)
+
+
+def find_missing_files(file_paths: list) -> list:
+    '''
+    Find which of the given paths are not existing regular files.
+    Paths are grouped by directory so each directory is listed once (one readdir instead of one stat per file).
+    Files are matched as (directory, normcase(name)) pairs split from the given path, never as rejoined path strings;
+    a name not matched in the listing (e.g., typed in another case on a case-insensitive filesystem) is stat'ed directly.
+
+    :param file_paths: List of file paths to check
+    :return: The paths that do not exist (or are not files), in their original order
+    '''
+    split_paths = [(file_path, *os.path.split(file_path)) for file_path in file_paths]
+
+    names_by_directory = {}
+    for _, directory, name in split_paths:
+        names_by_directory.setdefault(directory, set()).add(os.path.normcase(name))
+
+    existing_files = set()
+    for directory, names in names_by_directory.items():
+        try:
+            with os.scandir(directory or '.') as entries:
+                for entry in entries:
+                    name = os.path.normcase(entry.name)
+                    if name in names and entry.is_file():
+                        existing_files.add((directory, name))
+        except OSError:
+            pass
+
+    return [
+        file_path for file_path, directory, name in split_paths
+        if (directory, os.path.normcase(name)) not in existing_files and not os.path.isfile(file_path)
+    ]